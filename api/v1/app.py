@@ -3,14 +3,73 @@
 Main Flask Application for AirBnB Clone v3 API
 """
 from os import getenv
-from flask import Flask, jsonify
-from flask_cors import CORS
+import orjson
+from flask import Flask, request, Response
+from flask.json.provider import DefaultJSONProvider
 from models import storage
-from api.v1.views import app_views
+from api.v1.views import app_views, cache
+
+_NOT_FOUND = orjson.dumps({"error": "Not found"})
+
+
+class OrjsonProvider(DefaultJSONProvider):
+    """
+    JSON provider that serializes responses with orjson instead of the
+    standard library json module
+    """
+
+    def dumps(self, obj, **kwargs):
+        """
+        Serializes obj to a JSON string, honoring the indent and sort_keys
+        arguments passed by jsonify
+        """
+        option = orjson.OPT_NON_STR_KEYS
+        if kwargs.get("indent"):
+            option |= orjson.OPT_INDENT_2
+        if kwargs.get("sort_keys", self.sort_keys):
+            option |= orjson.OPT_SORT_KEYS
+        return orjson.dumps(obj, default=self.default,
+                            option=option).decode()
+
+    def loads(self, s, **kwargs):
+        """
+        Deserializes a JSON string or bytes object with orjson
+        """
+        return orjson.loads(s)
+
 
 app = Flask(__name__)
-CORS(app, resources={r"/*" : {"origins" : "0.0.0.0"}})
+app.json = OrjsonProvider(app)
+app.json.compact = True
+app.json.sort_keys = False
 app.register_blueprint(app_views)
+cache.init_app(app, config={
+    "CACHE_TYPE": "SimpleCache",
+    "CACHE_DEFAULT_TIMEOUT": int(getenv('HBNB_API_CACHE_TIMEOUT', '30'))
+})
+
+if getenv('HBNB_API_CORS_BY_PROXY') != '1':
+    from flask_cors import CORS
+    CORS(app, resources={r"/*": {"origins": "0.0.0.0"}})
+
+_WRITE_METHODS = frozenset({"POST", "PUT", "DELETE"})
+
+
+@app.after_request
+def commit(response):
+    """
+    Commits the changes made by a successful write request in a single
+    save, or rolls back the database session if the request failed
+    (file storage keeps no per-request changes to discard)
+    """
+    if request.method in _WRITE_METHODS:
+        if response.status_code < 400:
+            storage.save()
+            cache.delete("stats")
+        else:
+            storage.rollback()
+    return response
+
 
 @app.teardown_appcontext
 def tear_down(error):
@@ -26,7 +85,7 @@ def err404(error):
     handler for 404 errors that returns a JSON-formatted 404 status code
     response.
     """
-    return jsonify({"error": "Not found"}), 404
+    return Response(_NOT_FOUND, status=404, mimetype="application/json")
 
 if __name__ == "__main__":
     host = getenv('HBNB_API_HOST', '0.0.0.0')
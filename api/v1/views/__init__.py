@@ -3,8 +3,10 @@
 Initialize the Blueprint for API v1 views
 """
 from flask import Blueprint
+from flask_caching import Cache
 
 app_views = Blueprint("app_views", __name__, url_prefix="/api/v1")
+cache = Cache()
 
 from api.v1.views.index import *
 from api.v1.views.states import *
@@ -0,0 +1,232 @@
+#!/usr/bin/python3
+"""Generic class-based views for the plain CRUD resources of the API.
+
+The State, User and Review endpoints all follow the same pattern: a group
+URL that lists and creates objects, and an item URL that fetches, updates
+and deletes a single object. ItemAPI and GroupAPI implement that pattern
+once as Flask MethodViews parameterized by the model class, so each
+resource registers two URL rules instead of five routes.
+"""
+
+from datetime import datetime
+from flask import jsonify, abort, request, Response
+from flask.views import MethodView
+from models import storage
+from api.v1.views import app_views
+from api.v1.views.helpers import json_list_response, list_etag
+from api.v1.views.helpers import body_error, require_json
+from api.v1.views.helpers import MAX_ATTRIBUTES
+
+
+class ItemAPI(MethodView):
+    """Retrieve, update and delete a single object of a model.
+
+    Attributes:
+        model (type): The model class served by the view.
+        ignored_keys (frozenset): Attributes that an update must not modify.
+    """
+
+    init_every_request = False
+
+    def __init__(self, model, ignored_keys):
+        self.model = model
+        self.ignored_keys = ignored_keys
+
+    def get(self, id):
+        """Retrieve the object with the given ID.
+
+        Args:
+            id (str): The unique identifier of the object to retrieve.
+
+        Returns:
+            flask.Response: JSON response containing the requested object
+                as a dictionary.
+
+        Raises:
+            werkzeug.exceptions.NotFound: If the object with the specified ID
+                does not exist in storage (HTTP 404).
+        """
+        obj = storage.get(self.model, id)
+        if not obj:
+            abort(404)
+        return jsonify(obj.to_dict())
+
+    @require_json
+    def put(self, id, data_dict):
+        """Update the object with the given ID with new attribute values.
+
+        Attributes listed in ignored_keys are protected and left unchanged.
+
+        Args:
+            id (str): The unique identifier of the object to update.
+            data_dict (dict): The JSON body parsed by require_json, or
+                None if it is not a JSON object.
+
+        Returns:
+            flask.Response: JSON response containing the updated object
+                as a dictionary with HTTP 200 status.
+
+        Raises:
+            werkzeug.exceptions.NotFound: If the object with the specified ID
+                does not exist in storage (HTTP 404).
+            werkzeug.exceptions.BadRequest: Returns HTTP 400 with error
+                message if:
+                - The request body is not valid JSON ("Not a JSON" error).
+                - The payload has more than MAX_ATTRIBUTES keys
+                  ("Too many attributes" error).
+        """
+        obj = storage.get(self.model, id)
+        if not obj:
+            abort(404)
+        error = body_error(data_dict, max_attributes=MAX_ATTRIBUTES)
+        if error:
+            return error
+
+        for key in data_dict.keys() - self.ignored_keys:
+            setattr(obj, key, data_dict[key])
+
+        obj.updated_at = datetime.utcnow()
+        return jsonify(obj.to_dict())
+
+    def delete(self, id):
+        """Delete the object with the given ID from storage.
+
+        Args:
+            id (str): The unique identifier of the object to delete.
+
+        Returns:
+            flask.Response: Empty JSON object with HTTP 200 status on
+                successful deletion.
+
+        Raises:
+            werkzeug.exceptions.NotFound: If the object with the specified ID
+                does not exist in storage (HTTP 404).
+        """
+        if not storage.delete_by_id(self.model, id):
+            abort(404)
+
+        return jsonify({})
+
+
+class GroupAPI(MethodView):
+    """List and create the objects of a model, optionally scoped to a parent.
+
+    Attributes:
+        model (type): The model class served by the view.
+        ignored_keys (frozenset): Attributes of the payload that are not copied
+            onto a new object, unless they are also required.
+        required (tuple): Fields a new object must have, checked in order.
+        parent (tuple): Optional (parent model, foreign key) pair; when set,
+            the URL carries the parent ID under the foreign key's name.
+        references (dict): Maps required fields to the model whose object they
+            must reference.
+    """
+
+    init_every_request = False
+
+    def __init__(self, model, ignored_keys, required, parent, references):
+        self.model = model
+        self.ignored_keys = ignored_keys
+        self.required = required
+        self.parent = parent
+        self.references = references
+
+    def _check_parent(self, kwargs):
+        """Return the parent filter of the request, aborting with 404 if the
+        parent object does not exist."""
+        if self.parent is None:
+            return {}
+        parent_model, foreign_key = self.parent
+        if not storage.exists(parent_model, kwargs[foreign_key]):
+            abort(404)
+        return {foreign_key: kwargs[foreign_key]}
+
+    def get(self, **kwargs):
+        """Retrieve all objects of the model, or those of the parent object.
+
+        The response carries an ETag of the listed objects; a client that
+        sends it back in If-None-Match gets a 304 without the list being
+        serialized.
+
+        Returns:
+            flask.Response: JSON response containing a list of the objects,
+                where each object is represented as a dictionary, or an empty
+                HTTP 304 response if the client's copy is current.
+
+        Raises:
+            werkzeug.exceptions.NotFound: If the parent object does not exist
+                in storage (HTTP 404).
+        """
+        filters = self._check_parent(kwargs)
+        etag = list_etag(self.model, **filters)
+        if request.if_none_match.contains(etag):
+            response = Response(status=304)
+        elif filters:
+            objs = storage.query_by(self.model, **filters)
+            response = json_list_response(self.model, objs)
+        else:
+            objs = list(storage.all(self.model).values())
+            response = json_list_response(self.model, objs)
+        response.set_etag(etag)
+        return response
+
+    @require_json
+    def post(self, data_dict, **kwargs):
+        """Create a new object of the model and store it.
+
+        Args:
+            data_dict (dict): The JSON body parsed by require_json, or
+                None if it is not a JSON object.
+
+        Returns:
+            tuple: A tuple containing:
+                - flask.Response: JSON response with the created object.
+                - int: HTTP status code (201 for success).
+
+        Raises:
+            werkzeug.exceptions.NotFound: If the parent object, or an object
+                referenced by a required field, does not exist in storage
+                (HTTP 404).
+            werkzeug.exceptions.BadRequest: Returns HTTP 400 with error
+                message if:
+                - The request body is not valid JSON ("Not a JSON" error).
+                - A required field is missing from the request payload
+                  ("Missing <field>" error).
+        """
+        filters = self._check_parent(kwargs)
+        error = body_error(data_dict, self.required, self.references)
+        if error:
+            return error
+
+        new_obj = self.model()
+        for key in data_dict.keys() - self.ignored_keys:
+            setattr(new_obj, key, data_dict[key])
+        for field in self.ignored_keys.intersection(self.required):
+            setattr(new_obj, field, data_dict[field])
+        for key, value in filters.items():
+            setattr(new_obj, key, value)
+        storage.new(new_obj)
+        return jsonify(new_obj.to_dict()), 201
+
+
+def register_api(name, model, ignored_keys, required=(), parent=None,
+                 references=None, group_url=None):
+    """Register the group and item URL rules of a CRUD resource.
+
+    Args:
+        name (str): The resource name, used in the URLs and endpoint names.
+        model (type): The model class of the resource.
+        ignored_keys (frozenset): Attributes clients may not set directly.
+        required (tuple): Fields a new object must have, checked in order.
+        parent (tuple): Optional (parent model, foreign key) pair scoping the
+            group URL to a parent object.
+        references (dict): Maps required fields to the model they reference.
+        group_url (str): The group URL; defaults to "/<name>".
+    """
+    item = ItemAPI.as_view(name + "_item", model, ignored_keys)
+    group = GroupAPI.as_view(name + "_group", model, ignored_keys, required,
+                             parent, references or {})
+    app_views.add_url_rule("/{}/<id>".format(name), view_func=item,
+                           strict_slashes=False)
+    app_views.add_url_rule(group_url or "/" + name, view_func=group,
+                           strict_slashes=False)
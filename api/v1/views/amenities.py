@@ -10,13 +10,19 @@ The module integrates with Flask for routing and request handling, and uses a
 persistent storage backend for data persistence.
 """
 
+from datetime import datetime
 from models import storage
 from models.amenity import Amenity
 from api.v1.views import app_views
-from flask import jsonify, abort, request
+from api.v1.views.helpers import etag_for, json_list_response, require_json
+from api.v1.views.helpers import body_error, MAX_ATTRIBUTES
+from flask import jsonify, abort
+
+_IGNORED_KEYS = frozenset({"id", "created_at", "updated_at", "__class__"})
 
 
 @app_views.route("/amenities", methods=["GET"], strict_slashes=False)
+@etag_for(Amenity)
 def list_all_amenities():
     """Retrieve all Amenity objects from storage.
 
@@ -27,9 +33,8 @@ def list_all_amenities():
         flask.Response: JSON response containing a list of all amenity objects,
             where each amenity is represented as a dictionary.
     """
-    all_amenity_dict = storage.all(Amenity)
-    all_data_amenity_list = [all_amenity_dict[x].to_dict() for x in all_amenity_dict]
-    return jsonify(all_data_amenity_list)
+    all_amenities = list(storage.all(Amenity).values())
+    return json_list_response(Amenity, all_amenities)
 
 
 @app_views.route("/amenities/<amenity_id>", methods=["GET"], strict_slashes=False)
@@ -79,14 +84,14 @@ def delete_a_amenity(amenity_id):
     amenity = storage.get(Amenity, amenity_id)
     if amenity:
         storage.delete(amenity)
-        storage.save()
         return jsonify({})
     else:
         abort(404)
 
 
 @app_views.route("/amenities", methods=["POST"], strict_slashes=False)
-def create_amenity():
+@require_json
+def create_amenity(data_dict):
     """Create a new Amenity object and store it in the database.
 
     Accepts a JSON payload containing amenity attributes and creates a new Amenity
@@ -105,21 +110,20 @@ def create_amenity():
             - The "name" field is missing from the request payload
               ("Missing name" error).
     """
-    data_dict = request.get_json(silent=True)
-    if not data_dict:
-        return (jsonify({"error": "Not a JSON"}), 400)
-
-    if not data_dict.get("name", None):
-        return (jsonify({"error": "Missing name"}), 400)
+    error = body_error(data_dict, ("name",))
+    if error:
+        return error
 
-    new_amenity = Amenity(**data_dict)
+    new_amenity = Amenity()
+    for key in data_dict.keys() - _IGNORED_KEYS:
+        setattr(new_amenity, key, data_dict[key])
     storage.new(new_amenity)
-    storage.save()
     return jsonify(new_amenity.to_dict()), 201
 
 
 @app_views.route("/amenities/<amenity_id>", methods=["PUT"], strict_slashes=False)
-def update_amenity(amenity_id):
+@require_json
+def update_amenity(amenity_id, data_dict):
     """Update a specific Amenity object with new attribute values.
 
     Modifies an existing Amenity instance by applying attributes from a JSON
@@ -129,6 +133,8 @@ def update_amenity(amenity_id):
 
     Args:
         amenity_id (str): The unique identifier of the amenity to update.
+        data_dict (dict): The JSON body parsed by require_json, or
+            None if it is not a JSON object.
 
     Returns:
         flask.Response: JSON response containing the updated amenity object
@@ -139,20 +145,18 @@ def update_amenity(amenity_id):
             does not exist in storage (HTTP 404).
         werkzeug.exceptions.BadRequest: Returns HTTP 400 with error message if:
             - The request body is not valid JSON ("Not a JSON" error).
+            - The payload has more than MAX_ATTRIBUTES keys
+              ("Too many attributes" error).
     """
     amenity = storage.get(Amenity, amenity_id)
     if not amenity:
         abort(404)
+    error = body_error(data_dict, max_attributes=MAX_ATTRIBUTES)
+    if error:
+        return error
 
-    data_dict = request.get_json(silent=True)
-    if not data_dict:
-        return (jsonify({"error": "Not a JSON"}), 400)
-
-    ignored_keys = ["id", "created_at", "updated_at", "__class__"]
-
-    for key, value in data_dict.items():
-        if key not in ignored_keys:
-            setattr(amenity, key, value)
+    for key in data_dict.keys() - _IGNORED_KEYS:
+        setattr(amenity, key, data_dict[key])
 
-    amenity.save()
+    amenity.updated_at = datetime.utcnow()
     return jsonify(amenity.to_dict())
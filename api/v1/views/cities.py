@@ -10,14 +10,21 @@ The module integrates with Flask for routing and request handling, and uses a
 persistent storage backend for data persistence.
 """
 
+from datetime import datetime
 from models import storage
 from models.city import City
 from models.state import State
 from api.v1.views import app_views
-from flask import jsonify, abort, request
+from api.v1.views.helpers import body_error, etag_for, json_list_response
+from api.v1.views.helpers import MAX_ATTRIBUTES, require_json
+from flask import jsonify, abort
+
+_IGNORED_KEYS = frozenset({"id", "created_at", "updated_at", "__class__",
+                           "state_id"})
 
 
 @app_views.route("/states/<state_id>/cities", methods=["GET"], strict_slashes=False)
+@etag_for(City, parent=State, state_id="state_id")
 def list_cities_of_state(state_id):
     """Retrieve all City objects associated with a specific State.
 
@@ -37,13 +44,8 @@ def list_cities_of_state(state_id):
         werkzeug.exceptions.NotFound: If the state with the specified ID
             does not exist in storage (HTTP 404).
     """
-    state = storage.get(State, state_id)
-
-    if not state:
-        abort(404)
-
-    all_cities_of_state_list = [x.to_dict() for x in state.cities]
-    return jsonify(all_cities_of_state_list)
+    cities = storage.query_by(City, state_id=state_id)
+    return json_list_response(City, cities)
 
 
 @app_views.route("/cities/<city_id>", methods=["GET"], strict_slashes=False)
@@ -93,14 +95,14 @@ def delete_a_city(city_id):
     city = storage.get(City, city_id)
     if city:
         storage.delete(city)
-        storage.save()
         return jsonify({})
     else:
         abort(404)
 
 
 @app_views.route("/states/<state_id>/cities", methods=["POST"], strict_slashes=False)
-def create_city(state_id):
+@require_json
+def create_city(state_id, data_dict):
     """Create a new City object and associate it with a specific State.
 
     Accepts a JSON payload containing city attributes and creates a new City
@@ -112,6 +114,8 @@ def create_city(state_id):
     Args:
         state_id (str): The unique identifier of the parent state to which
             the new city will be associated.
+        data_dict (dict): The JSON body parsed by require_json, or
+            None if it is not a JSON object.
 
     Returns:
         tuple: A tuple containing:
@@ -127,26 +131,23 @@ def create_city(state_id):
             - The "name" field is missing from the request payload
               ("Missing name" error).
     """
-    state = storage.get(State, state_id)
-    if not state:
+    if not storage.exists(State, state_id):
         abort(404)
-
-    data_dict = request.get_json(silent=True)
-    if not data_dict:
-        return (jsonify({"error": "Not a JSON"}), 400)
-
-    if not data_dict.get("name", None):
-        return (jsonify({"error": "Missing name"}), 400)
-
-    data_dict["state_id"] = state_id
-    new_city = City(**data_dict)
+    error = body_error(data_dict, ("name",))
+    if error:
+        return error
+
+    new_city = City()
+    for key in data_dict.keys() - _IGNORED_KEYS:
+        setattr(new_city, key, data_dict[key])
+    new_city.state_id = state_id
     storage.new(new_city)
-    storage.save()
     return jsonify(new_city.to_dict()), 201
 
 
 @app_views.route("/cities/<city_id>", methods=["PUT"], strict_slashes=False)
-def update_city(city_id):
+@require_json
+def update_city(city_id, data_dict):
     """Update a specific City object with new attribute values.
 
     Modifies an existing City instance by applying attributes from a JSON
@@ -156,6 +157,8 @@ def update_city(city_id):
 
     Args:
         city_id (str): The unique identifier of the city to update.
+        data_dict (dict): The JSON body parsed by require_json, or
+            None if it is not a JSON object.
 
     Returns:
         flask.Response: JSON response containing the updated city object
@@ -166,20 +169,18 @@ def update_city(city_id):
             does not exist in storage (HTTP 404).
         werkzeug.exceptions.BadRequest: Returns HTTP 400 with error message if:
             - The request body is not valid JSON ("Not a JSON" error).
+            - The payload has more than MAX_ATTRIBUTES keys
+              ("Too many attributes" error).
     """
     city = storage.get(City, city_id)
     if not city:
         abort(404)
+    error = body_error(data_dict, max_attributes=MAX_ATTRIBUTES)
+    if error:
+        return error
 
-    data_dict = request.get_json(silent=True)
-    if not data_dict:
-        return (jsonify({"error": "Not a JSON"}), 400)
-
-    ignored_keys = ["id", "created_at", "updated_at", "__class__", "state_id"]
-
-    for key, value in data_dict.items():
-        if key not in ignored_keys:
-            setattr(city, key, value)
+    for key in data_dict.keys() - _IGNORED_KEYS:
+        setattr(city, key, data_dict[key])
 
-    city.save()
+    city.updated_at = datetime.utcnow()
     return jsonify(city.to_dict())
@@ -0,0 +1,151 @@
+#!/usr/bin/python3
+"""
+Helper functions shared by the API views
+"""
+from functools import wraps
+import hashlib
+import orjson
+from flask import abort, jsonify, make_response, request, Response
+from flask import stream_with_context
+from models import storage
+
+# maximum number of attributes an update request may set at once
+MAX_ATTRIBUTES = 50
+
+# lists with more objects than this are streamed instead of serialized at once
+STREAM_THRESHOLD = 1000
+
+
+def parse_json_body():
+    """
+    Returns the request body parsed as a JSON object, or None if the request
+    is not sent as JSON or its body is not a JSON object
+    """
+    if not request.is_json:
+        return None
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        return None
+    if type(data) is not dict:
+        return None
+    return data
+
+
+def require_json(view):
+    """
+    Decorator that parses the request body once with parse_json_body() and
+    passes it to the view as the data_dict keyword argument, None if the body
+    is not a JSON object; the view validates it with body_error() once it has
+    looked up the objects named in the URL
+    """
+    @wraps(view)
+    def wrapper(*args, **kwargs):
+        """parses the JSON body before calling view"""
+        return view(*args, data_dict=parse_json_body(), **kwargs)
+    return wrapper
+
+
+def body_error(data_dict, required=(), references=None, max_attributes=None):
+    """
+    Returns the 400 response for a body that is not a JSON object, lacks one
+    of the required fields, or has more than max_attributes keys, and None
+    for a valid body; aborts with 404 if a required field named in
+    references does not reference an existing object of its model
+    """
+    if data_dict is None:
+        return jsonify({"error": "Not a JSON"}), 400
+    for field in required:
+        if not data_dict.get(field, None):
+            return jsonify({"error": "Missing " + field}), 400
+        reference = references.get(field) if references else None
+        if reference and not storage.exists(reference, data_dict[field]):
+            abort(404)
+    if max_attributes is not None and len(data_dict) > max_attributes:
+        return jsonify({"error": "Too many attributes"}), 400
+    return None
+
+
+def json_response(data, status=200):
+    """
+    Returns a JSON response built from data, which is either already
+    serialized bytes or an object that orjson serializes directly
+    """
+    if type(data) is not bytes:
+        data = orjson.dumps(data)
+    return Response(data, status=status, mimetype="application/json")
+
+
+def stream_json_array(objs, serialize):
+    """
+    Generates the JSON array of serialize(obj) for every obj of objs one
+    element at a time, so the whole array is never held in memory
+    """
+    yield b"["
+    separator = b""
+    for obj in objs:
+        yield separator + orjson.dumps(serialize(obj))
+        separator = b","
+    yield b"]"
+
+
+def json_stream_response(objs, serialize):
+    """
+    Returns a streamed JSON response of the array of serialize(obj) for
+    every obj of objs
+    """
+    return Response(stream_with_context(stream_json_array(objs, serialize)),
+                    mimetype="application/json")
+
+
+def json_list_response(cls, objs):
+    """
+    Returns the JSON array of the to_dict() dictionaries of objs, a sized
+    collection of cls instances; lists longer than STREAM_THRESHOLD are
+    streamed, shorter ones are serialized in one call
+    """
+    if len(objs) > STREAM_THRESHOLD:
+        return json_stream_response(objs, cls.dict_serializer())
+    return json_response(cls.bulk_to_dicts(objs))
+
+
+def list_etag(cls, **filters):
+    """
+    Returns the ETag of the list of cls objects matching filters, derived
+    from the storage fingerprint of those objects so that every worker
+    computes the same tag for the same data
+    """
+    tag = "{}:{}:{}".format(cls.__name__, sorted(filters.items()),
+                            storage.fingerprint(cls, **filters))
+    return hashlib.md5(tag.encode()).hexdigest()
+
+
+def etag_for(cls, parent=None, **filter_args):
+    """
+    Decorator for list views that tags the response with an ETag derived
+    from the number and latest update of the listed cls objects, and
+    answers 304 Not Modified without running the view when the client
+    already holds that version. filter_args maps cls attributes to the
+    view arguments that restrict the listed objects; when parent is given,
+    those arguments are ids of parent objects, and a missing parent is a
+    404 rather than the tag of an empty list.
+    """
+    def decorator(view):
+        """Wraps view with the ETag check"""
+        @wraps(view)
+        def wrapper(*args, **kwargs):
+            """Compares the current ETag with If-None-Match"""
+            filters = {attr: kwargs[arg] for attr, arg in filter_args.items()}
+            if parent is not None and \
+                    not all(storage.exists(parent, parent_id)
+                            for parent_id in filters.values()):
+                abort(404)
+            etag = list_etag(cls, **filters)
+            if request.if_none_match.contains(etag):
+                response = Response(status=304)
+            else:
+                response = make_response(view(*args, **kwargs))
+            response.set_etag(etag)
+            return response
+        return wrapper
+    return decorator
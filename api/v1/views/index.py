@@ -11,9 +11,10 @@ from models.review import Review
 from models.state import State
 from models.user import User
 
-from api.v1.views import app_views
-from flask import jsonify
+from api.v1.views import app_views, cache
+from api.v1.views.helpers import json_response
 
+_STATUS_OK = b'{"status":"OK"}'
 
 
 classes = {"amenity": Amenity, "city": City,
@@ -25,14 +26,14 @@ def status():
     """
     Returns the status of the API
     """
-    return jsonify({"status": "OK"})
+    return json_response(_STATUS_OK)
 
 @app_views.route("/stats", methods=["GET"], strict_slashes=False)
+@cache.cached(key_prefix="stats")
 def count():
     """
     Retrieves the number of each objects by type
     """
-    stats = {}
-    for key in classes:
-        stats[key] = storage.count(classes[key])
-    return jsonify(stats)
+    counts = storage.count_all(classes.values())
+    stats = {key: counts[cls.__name__] for key, cls in classes.items()}
+    return json_response(stats)
@@ -10,15 +10,22 @@ The module integrates with Flask for routing and request handling, and uses a
 persistent storage backend for data persistence.
 """
 
+from datetime import datetime
 from models import storage
 from models.place import Place
 from models.city import City
 from models.user import User
 from api.v1.views import app_views
-from flask import jsonify, abort, request
+from api.v1.views.helpers import body_error, etag_for, json_list_response
+from api.v1.views.helpers import MAX_ATTRIBUTES, require_json
+from flask import jsonify, abort
+
+_IGNORED_KEYS = frozenset({"id", "created_at", "updated_at", "__class__",
+                           "user_id", "city_id"})
 
 
 @app_views.route("/cities/<city_id>/places", methods=["GET"], strict_slashes=False)
+@etag_for(Place, parent=City, city_id="city_id")
 def list_places_of_city(city_id):
     """Retrieve all Place objects associated with a specific City.
 
@@ -38,13 +45,8 @@ def list_places_of_city(city_id):
         werkzeug.exceptions.NotFound: If the city with the specified ID
             does not exist in storage (HTTP 404).
     """
-    city = storage.get(City, city_id)
-
-    if not city:
-        abort(404)
-
-    all_places_of_city_list = [x.to_dict() for x in city.places]
-    return jsonify(all_places_of_city_list)
+    places = storage.query_by(Place, city_id=city_id)
+    return json_list_response(Place, places)
 
 
 @app_views.route("/places/<place_id>", methods=["GET"], strict_slashes=False)
@@ -95,12 +97,12 @@ def delete_a_place(place_id):
         abort(404)
 
     storage.delete(place)
-    storage.save()
     return jsonify({})
 
 
 @app_views.route("/cities/<city_id>/places", methods=["POST"], strict_slashes=False)
-def create_place(city_id):
+@require_json
+def create_place(city_id, data_dict):
     """Create a new Place object and associate it with a specific City.
 
     Accepts a JSON payload containing place attributes and creates a new Place
@@ -113,6 +115,8 @@ def create_place(city_id):
     Args:
         city_id (str): The unique identifier of the parent city to which
             the new place will be associated.
+        data_dict (dict): The JSON body parsed by require_json, or
+            None if it is not a JSON object.
 
     Returns:
         tuple: A tuple containing:
@@ -132,33 +136,24 @@ def create_place(city_id):
             - The "name" field is missing from the request payload
               ("Missing name" error).
     """
-    city = storage.get(City, city_id)
-    if not city:
-        abort(404)
-
-    data_dict = request.get_json(silent=True)
-    if not data_dict:
-        return (jsonify({"error": "Not a JSON"}), 400)
-
-    if not data_dict.get("user_id", None):
-        return (jsonify({"error": "Missing user_id"}), 400)
-
-    user = storage.get(User, data_dict["user_id"])
-    if not user:
+    if not storage.exists(City, city_id):
         abort(404)
-
-    if not data_dict.get("name", None):
-        return (jsonify({"error": "Missing name"}), 400)
-
-    data_dict["city_id"] = city_id
-    new_place = Place(**data_dict)
+    error = body_error(data_dict, ("user_id", "name"), {"user_id": User})
+    if error:
+        return error
+
+    new_place = Place()
+    for key in data_dict.keys() - _IGNORED_KEYS:
+        setattr(new_place, key, data_dict[key])
+    new_place.city_id = city_id
+    new_place.user_id = data_dict["user_id"]
     storage.new(new_place)
-    storage.save()
     return jsonify(new_place.to_dict()), 201
 
 
 @app_views.route("/places/<place_id>", methods=["PUT"], strict_slashes=False)
-def update_place(place_id):
+@require_json
+def update_place(place_id, data_dict):
     """Update a specific Place object with new attribute values.
 
     Modifies an existing Place instance by applying attributes from a JSON
@@ -169,6 +164,8 @@ def update_place(place_id):
 
     Args:
         place_id (str): The unique identifier of the place to update.
+        data_dict (dict): The JSON body parsed by require_json, or
+            None if it is not a JSON object.
 
     Returns:
         flask.Response: JSON response containing the updated place object
@@ -179,20 +176,18 @@ def update_place(place_id):
             does not exist in storage (HTTP 404).
         werkzeug.exceptions.BadRequest: Returns HTTP 400 with error message if:
             - The request body is not valid JSON ("Not a JSON" error).
+            - The payload has more than MAX_ATTRIBUTES keys
+              ("Too many attributes" error).
     """
     place = storage.get(Place, place_id)
     if not place:
         abort(404)
+    error = body_error(data_dict, max_attributes=MAX_ATTRIBUTES)
+    if error:
+        return error
 
-    data_dict = request.get_json(silent=True)
-    if not data_dict:
-        return (jsonify({"error": "Not a JSON"}), 400)
-
-    ignored_keys = ["id", "created_at", "updated_at", "__class__", "user_id", "city_id"]
-
-    for key, value in data_dict.items():
-        if key not in ignored_keys:
-            setattr(place, key, value)
+    for key in data_dict.keys() - _IGNORED_KEYS:
+        setattr(place, key, data_dict[key])
 
-    place.save()
+    place.updated_at = datetime.utcnow()
     return jsonify(place.to_dict())
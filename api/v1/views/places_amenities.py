@@ -12,12 +12,11 @@ It integrates with Flask for routing and request handling, and uses a persistent
 storage backend for data persistence.
 """
 
-from models import storage
+from models import storage, storage_t
 from models.place import Place
 from models.amenity import Amenity
 from api.v1.views import app_views
-from flask import jsonify, abort, make_response, request
-from os import environ
+from flask import jsonify, abort, make_response
 
 
 @app_views.route('/places/<place_id>/amenities', methods=['GET'], strict_slashes=False)
@@ -42,15 +41,15 @@ def get_place_amenities(place_id):
         werkzeug.exceptions.NotFound: If the place with the specified ID
             does not exist in storage (HTTP 404).
     """
-    place = storage.get(Place, place_id)
+    place = storage.get_with(Place, place_id, "amenities")
     if not place:
         abort(404)
 
-    if environ.get('HBNB_TYPE_STORAGE') == "db":
+    if storage_t == "db":
         amenities = [amenity.to_dict() for amenity in place.amenities]
     else:
-        amenities = [storage.get(Amenity, a_id).to_dict()
-                     for a_id in place.amenity_ids]
+        linked = [storage.get(Amenity, a_id) for a_id in place.amenity_ids]
+        amenities = [amenity.to_dict() for amenity in linked if amenity]
 
     return jsonify(amenities)
 
@@ -62,9 +61,8 @@ def delete_place_amenity(place_id, amenity_id):
     Removes the association between an amenity and a place. Both the place and
     amenity must exist in storage; otherwise, a 404 error is returned. If the
     amenity is not currently linked to the place, a 404 error is also returned.
-    The function adapts its behavior based on the storage type: database storage
-    removes the object from the relationship collection, while file-based storage
-    removes the amenity ID from the list.
+    The link is removed directly, without loading the place, the amenity or the
+    place's amenity collection.
 
     Args:
         place_id (str): The unique identifier of the place from which the
@@ -82,22 +80,9 @@ def delete_place_amenity(place_id, amenity_id):
             - The amenity with the specified ID does not exist in storage (HTTP 404).
             - The amenity is not currently linked to the place (HTTP 404).
     """
-    place = storage.get(Place, place_id)
-    amenity = storage.get(Amenity, amenity_id)
-
-    if not place or not amenity:
+    if not storage.unlink(place_id, amenity_id):
         abort(404)
 
-    if environ.get('HBNB_TYPE_STORAGE') == "db":
-        if amenity not in place.amenities:
-            abort(404)
-        place.amenities.remove(amenity)
-    else:
-        if amenity_id not in place.amenity_ids:
-            abort(404)
-        place.amenity_ids.remove(amenity_id)
-
-    storage.save()
     return make_response(jsonify({}), 200)
 
 
@@ -109,9 +94,8 @@ def link_place_amenity(place_id, amenity_id):
     amenity must exist in storage; otherwise, a 404 error is returned. If the
     amenity is already linked to the place, the existing link is returned with
     HTTP 200 status. Otherwise, the new link is created and returned with HTTP
-    201 status. The function adapts its behavior based on the storage type:
-    database storage appends to the relationship collection, while file-based
-    storage appends the amenity ID to the list.
+    201 status. The link is added directly, without loading the place's amenity
+    collection.
 
     Args:
         place_id (str): The unique identifier of the place to which the
@@ -129,20 +113,11 @@ def link_place_amenity(place_id, amenity_id):
             - The place with the specified ID does not exist in storage (HTTP 404).
             - The amenity with the specified ID does not exist in storage (HTTP 404).
     """
-    place = storage.get(Place, place_id)
     amenity = storage.get(Amenity, amenity_id)
-
-    if not place or not amenity:
+    if not amenity or not storage.exists(Place, place_id):
         abort(404)
 
-    if environ.get('HBNB_TYPE_STORAGE') == "db":
-        if amenity in place.amenities:
-            return make_response(jsonify(amenity.to_dict()), 200)
-        place.amenities.append(amenity)
-    else:
-        if amenity_id in place.amenity_ids:
-            return make_response(jsonify(amenity.to_dict()), 200)
-        place.amenity_ids.append(amenity_id)
+    if not storage.link(place_id, amenity_id):
+        return make_response(jsonify(amenity.to_dict()), 200)
 
-    storage.save()
     return make_response(jsonify(amenity.to_dict()), 201)
@@ -0,0 +1,27 @@
+#!/usr/bin/python3
+"""
+Gunicorn configuration for serving the AirBnB Clone v3 API
+
+Usage: gunicorn -c gunicorn_conf.py api.v1.app:app
+"""
+from multiprocessing import cpu_count
+from os import getenv
+
+try:
+    import pymysql
+    # the gevent workers can only yield on sockets created by a pure
+    # Python driver, so PyMySQL stands in for MySQLdb when available
+    pymysql.install_as_MySQLdb()
+except ImportError:
+    pass
+
+bind = "{}:{}".format(getenv('HBNB_API_HOST', '0.0.0.0'),
+                      getenv('HBNB_API_PORT', '5000'))
+if getenv('HBNB_TYPE_STORAGE') == 'db':
+    workers = int(getenv('HBNB_API_WORKERS', cpu_count() * 2 + 1))
+else:
+    # every worker would hold its own copy of the file storage objects and
+    # overwrite file.json with it, losing the other workers' writes
+    workers = 1
+worker_class = 'gevent'
+worker_connections = 1000
@@ -4,27 +4,42 @@ Contains class BaseModel
 """
 
 from datetime import datetime
+from functools import lru_cache
 import models
 from os import getenv
 import sqlalchemy
 from sqlalchemy import Column, String, DateTime
+from sqlalchemy.dialects import mysql
 from sqlalchemy.ext.declarative import declarative_base
 import uuid
 
 time = "%Y-%m-%dT%H:%M:%S.%f"
 
+
+@lru_cache(maxsize=65536)
+def strftime(dt):
+    """returns dt formatted with time; memoized, since every listing formats
+    the timestamps of unchanged objects again"""
+    return dt.strftime(time)
+
+
 if models.storage_t == "db":
     Base = declarative_base()
 else:
     Base = object
 
+# MySQL's plain DATETIME drops the microseconds, so two updates within one
+# second would leave the same updated_at; tables created before this change
+# need ALTER TABLE ... MODIFY updated_at DATETIME(6)
+Timestamp = DateTime().with_variant(mysql.DATETIME(fsp=6), "mysql")
+
 
 class BaseModel:
     """The BaseModel class from which future classes will be derived"""
     if models.storage_t == "db":
         id = Column(String(60), primary_key=True)
-        created_at = Column(DateTime, default=datetime.utcnow)
-        updated_at = Column(DateTime, default=datetime.utcnow)
+        created_at = Column(Timestamp, default=datetime.utcnow)
+        updated_at = Column(Timestamp, default=datetime.utcnow)
 
     def __init__(self, *args, **kwargs):
         """Initialization of the base model"""
@@ -62,9 +77,9 @@ class BaseModel:
         """returns a dictionary containing all keys/values of the instance"""
         new_dict = self.__dict__.copy()
         if "created_at" in new_dict:
-            new_dict["created_at"] = new_dict["created_at"].strftime(time)
+            new_dict["created_at"] = strftime(new_dict["created_at"])
         if "updated_at" in new_dict:
-            new_dict["updated_at"] = new_dict["updated_at"].strftime(time)
+            new_dict["updated_at"] = strftime(new_dict["updated_at"])
         new_dict["__class__"] = self.__class__.__name__
         if "_sa_instance_state" in new_dict:
             del new_dict["_sa_instance_state"]
@@ -73,6 +88,42 @@ class BaseModel:
                 del new_dict["password"]
         return new_dict
 
+    @classmethod
+    def dict_serializer(cls):
+        """returns a function that maps an instance of cls to its to_dict()
+        dictionary, specialized to the mapped columns in DB mode"""
+        if models.storage_t != "db":
+            return cls.to_dict
+        fast_to_dict = cls.__dict__.get("_fast_to_dict")
+        if fast_to_dict is None:
+            fast_to_dict = cls._compile_to_dict()
+            cls._fast_to_dict = fast_to_dict
+        return fast_to_dict
+
+    @classmethod
+    def bulk_to_dicts(cls, objs):
+        """returns the to_dict() dictionaries of objs, all instances of cls"""
+        serialize = cls.dict_serializer()
+        return [serialize(obj) for obj in objs]
+
+    @classmethod
+    def _compile_to_dict(cls):
+        """generates a to_dict() function specialized to the mapped columns
+        of cls, which reads every attribute without any branching"""
+        items = []
+        for col in cls.__table__.columns:
+            if col.key in ("created_at", "updated_at"):
+                items.append('"{0}": strftime(self.{0})'.format(col.key))
+            elif col.key != "password":
+                items.append('"{0}": self.{0}'.format(col.key))
+        items.append('"__class__": "{}"'.format(cls.__name__))
+        source = ('def _fast_to_dict(self):\n'
+                  '    """returns the to_dict() dictionary of self"""\n'
+                  '    return {{{}}}\n').format(", ".join(items))
+        namespace = {"strftime": strftime}
+        exec(source, namespace)
+        return namespace["_fast_to_dict"]
+
     def delete(self):
         """delete the current instance from the storage"""
         models.storage.delete(self)
@@ -13,12 +13,14 @@ from models.state import State
 from models.user import User
 from os import getenv
 import sqlalchemy
-from sqlalchemy import create_engine
-from sqlalchemy.orm import scoped_session, sessionmaker
+from sqlalchemy import create_engine, func, select
+from sqlalchemy.orm import joinedload, scoped_session, sessionmaker
+from sqlalchemy.orm.interfaces import MANYTOONE
 
 classes = {"Amenity": Amenity, "City": City,
            "Place": Place, "Review": Review, "State": State, "User": User}
 
+
 class DBStorage:
     """interaacts with the MySQL database"""
     __engine = None
@@ -31,11 +33,20 @@ class DBStorage:
         HBNB_MYSQL_HOST = getenv('HBNB_MYSQL_HOST')
         HBNB_MYSQL_DB = getenv('HBNB_MYSQL_DB')
         HBNB_ENV = getenv('HBNB_ENV')
+        # every process keeps its own pool, so the workers together may hold
+        # workers * (pool_size + max_overflow) connections
+        pool_size = int(getenv('HBNB_MYSQL_POOL_SIZE', '5'))
+        max_overflow = int(getenv('HBNB_MYSQL_MAX_OVERFLOW', '2'))
         self.__engine = create_engine('mysql+mysqldb://{}:{}@{}/{}'.
                                       format(HBNB_MYSQL_USER,
                                              HBNB_MYSQL_PWD,
                                              HBNB_MYSQL_HOST,
-                                             HBNB_MYSQL_DB))
+                                             HBNB_MYSQL_DB),
+                                      pool_size=pool_size,
+                                      max_overflow=max_overflow,
+                                      pool_pre_ping=True,
+                                      pool_recycle=300,
+                                      pool_use_lifo=True)
         if HBNB_ENV == "test":
             Base.metadata.drop_all(self.__engine)
 
@@ -58,11 +69,33 @@ class DBStorage:
         """commit all changes of the current database session"""
         self.__session.commit()
 
+    def rollback(self):
+        """discard all uncommitted changes of the current database session"""
+        self.__session.rollback()
+
     def delete(self, obj=None):
         """delete from the current database session obj if not None"""
         if obj is not None:
             self.__session.delete(obj)
 
+    def delete_by_id(self, cls, id):
+        """Deletes the object of the class with this ID from the current
+        database session, returning False if there is no such object"""
+        if type(cls) is str:
+            cls = classes.get(cls, None)
+        if not id or cls not in classes.values():
+            return False
+        if any(rel.direction is not MANYTOONE
+               for rel in cls.__mapper__.relationships):
+            # dependent rows are cascaded or unlinked by the ORM, which
+            # needs the object loaded
+            obj = self.get(cls, id)
+            if obj is None:
+                return False
+            self.__session.delete(obj)
+            return True
+        return self.__session.query(cls).filter_by(id=id).delete() > 0
+
     def reload(self):
         """reloads data from the database"""
         Base.metadata.create_all(self.__engine)
@@ -75,7 +108,8 @@ class DBStorage:
         self.__session.remove()
 
     def get(self, cls, id):
-        """Returns the object based on the class and its ID, or None if not found"""
+        """Returns the object based on the class and its ID, or None if
+        not found"""
         if not id or not cls:
             return None
         if type(cls) is str:
@@ -87,10 +121,66 @@ class DBStorage:
             return None
 
         try:
-            obj = self.__session.query(cls).get(id)
+            obj = self.__session.get(cls, id)
             return obj
         except Exception:
-             return None
+            return None
+
+    def get_with(self, cls, id, *relationships):
+        """Returns the object based on the class and its ID, or None if
+        not found, with the named relationships loaded in the same query"""
+        if type(cls) is str:
+            cls = classes.get(cls, None)
+        if not id or cls not in classes.values():
+            return None
+
+        options = [joinedload(getattr(cls, name)) for name in relationships]
+        try:
+            return self.__session.get(cls, id, options=options)
+        except Exception:
+            return None
+
+    def exists(self, cls, id):
+        """Returns True if an object of the class with this ID exists,
+        querying only its primary key"""
+        if type(cls) is str:
+            cls = classes.get(cls, None)
+        if not id or cls not in classes.values():
+            return False
+        query = self.__session.query(cls.id).filter_by(id=id)
+        return query.scalar() is not None
+
+    def query_by(self, cls, **filters):
+        """Returns the list of cls objects whose attributes equal filters"""
+        return self.__session.query(cls).filter_by(**filters).all()
+
+    def link(self, place_id, amenity_id):
+        """Links the amenity to the place with a single INSERT into the
+        association table, returning False if they were already linked"""
+        from models.place import place_amenity
+        stmt = place_amenity.insert().values(place_id=place_id,
+                                             amenity_id=amenity_id)
+        stmt = stmt.prefix_with("IGNORE", dialect="mysql")
+        stmt = stmt.prefix_with("OR IGNORE", dialect="sqlite")
+        return self.__session.execute(stmt).rowcount > 0
+
+    def unlink(self, place_id, amenity_id):
+        """Unlinks the amenity from the place with a single DELETE from the
+        association table, returning False if they were not linked"""
+        from models.place import place_amenity
+        stmt = place_amenity.delete().where(
+            place_amenity.c.place_id == place_id,
+            place_amenity.c.amenity_id == amenity_id)
+        return self.__session.execute(stmt).rowcount > 0
+
+    def fingerprint(self, cls, **filters):
+        """Returns the number of cls objects matching filters, their latest
+        updated_at and a checksum of their ids, computed by the database in
+        one aggregate query. The checksum tells apart an object replaced by
+        another within the same microsecond"""
+        return tuple(self.__session.query(
+            func.count(cls.id), func.max(cls.updated_at),
+            func.sum(func.crc32(cls.id))).filter_by(**filters).one())
 
     def count(self, cls=None):
         """Returns the number of objects in storage matching the given class.
@@ -104,3 +194,16 @@ class DBStorage:
             return self.__session.query(cls).count()
 
         return 0
+
+    def count_all(self, cls_list=None):
+        """Returns a dictionary of object counts keyed by class name for each
+        class in cls_list (all classes if None), using a single query."""
+        if cls_list is None:
+            cls_list = classes.values()
+        cls_list = [cls for cls in cls_list if cls in classes.values()]
+        if not cls_list:
+            return {}
+        counts = self.__session.execute(select(*[
+            select(func.count()).select_from(cls).scalar_subquery()
+            for cls in cls_list])).one()
+        return {cls.__name__: num for cls, num in zip(cls_list, counts)}
@@ -3,7 +3,11 @@
 Contains the FileStorage class
 """
 
-import json
+from datetime import datetime
+import orjson
+import os
+import tempfile
+import threading
 from models.amenity import Amenity
 from models.base_model import BaseModel
 from models.city import City
@@ -23,68 +27,191 @@ class FileStorage:
     __file_path = "file.json"
     # dictionary - empty but will store all objects by <class name>.id
     __objects = {}
+    # tuple - (mtime, size) of the JSON file when it was last read or written
+    __file_stamp = None
+    # lock - serializes the saves of the threads of this process
+    __save_lock = threading.Lock()
+    # dictionary - the objects of __objects by class name, then by key
+    __by_class = {}
+    # the __objects dictionary indexed by __by_class and its length
+    __indexed = None
+    __indexed_len = 0
 
     def all(self, cls=None):
         """returns the dictionary __objects"""
         if cls is not None:
-            new_dict = {}
-            for key, value in self.__objects.items():
-                if cls == value.__class__ or cls == value.__class__.__name__:
-                    new_dict[key] = value
-            return new_dict
+            cls_name = cls if type(cls) is str else cls.__name__
+            return dict(self.__class_index().get(cls_name, {}))
         return self.__objects
 
+    def __class_index(self):
+        """returns __by_class, rebuilding it if __objects was replaced or
+        changed without going through new() or delete()"""
+        if FileStorage.__indexed is not self.__objects or \
+                FileStorage.__indexed_len != len(self.__objects):
+            by_class = {}
+            for key, obj in self.__objects.items():
+                by_class.setdefault(obj.__class__.__name__, {})[key] = obj
+            FileStorage.__by_class = by_class
+            FileStorage.__indexed = self.__objects
+            FileStorage.__indexed_len = len(self.__objects)
+        return FileStorage.__by_class
+
     def new(self, obj):
         """sets in __objects the obj with key <obj class name>.id"""
         if obj is not None:
-            key = obj.__class__.__name__ + "." + obj.id
+            cls_name = obj.__class__.__name__
+            key = cls_name + "." + obj.id
+            by_class = self.__class_index()
+            if key not in self.__objects:
+                FileStorage.__indexed_len += 1
             self.__objects[key] = obj
+            by_class.setdefault(cls_name, {})[key] = obj
+
+    def __discard(self, cls_name, key):
+        """removes key from __objects, returning False if it is missing"""
+        by_class = self.__class_index()
+        if self.__objects.pop(key, None) is None:
+            return False
+        FileStorage.__indexed_len -= 1
+        by_class[cls_name].pop(key, None)
+        return True
 
     def save(self):
         """serializes __objects to the JSON file (path: __file_path)"""
-        json_objects = {}
-        for key in self.__objects:
-            json_objects[key] = self.__objects[key].to_dict()
-        with open(self.__file_path, 'w') as f:
-            json.dump(json_objects, f)
+        with FileStorage.__save_lock:
+            json_objects = {}
+            for key, obj in list(self.__objects.items()):
+                json_objects[key] = obj.to_dict()
+            # a temporary file of its own, so that concurrent saves of
+            # other processes never write to or replace it
+            file_dir = os.path.dirname(os.path.abspath(self.__file_path))
+            fd, tmp_path = tempfile.mkstemp(dir=file_dir, suffix=".tmp")
+            try:
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(orjson.dumps(json_objects))
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, self.__file_path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+            FileStorage.__file_stamp = self.__stat_file()
 
     def reload(self):
         """deserializes the JSON file to __objects"""
         try:
-            with open(self.__file_path, 'r') as f:
-                jo = json.load(f)
+            stamp = self.__stat_file()
+            with open(self.__file_path, 'rb') as f:
+                jo = orjson.loads(f.read())
             for key in jo:
                 self.__objects[key] = classes[jo[key]["__class__"]](**jo[key])
+            FileStorage.__file_stamp = stamp
+            FileStorage.__indexed = None
         except Exception:
             pass
 
+    def __stat_file(self):
+        """returns the (mtime, size) of the JSON file, None if it is missing"""
+        try:
+            st = os.stat(self.__file_path)
+        except OSError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
     def delete(self, obj=None):
         """delete obj from __objects if it’s inside"""
         if obj is not None:
-            key = obj.__class__.__name__ + '.' + obj.id
-            if key in self.__objects:
-                del self.__objects[key]
+            cls_name = obj.__class__.__name__
+            self.__discard(cls_name, cls_name + '.' + obj.id)
+
+    def delete_by_id(self, cls, id):
+        """delete the object of the class with this ID from __objects,
+        returning False if there is no such object"""
+        if not cls or not id:
+            return False
+        cls_name = cls if type(cls) is str else cls.__name__
+        return self.__discard(cls_name, cls_name + "." + id)
+
+    def rollback(self):
+        """does nothing: __objects is shared by every request of the
+        process, so there is no per-request state to discard"""
+        pass
 
     def close(self):
-        """call reload() method for deserializing the JSON file to objects"""
-        self.reload()
+        """call reload() method for deserializing the JSON file to objects,
+        unless the file is unchanged since it was last read or written"""
+        if self.__stat_file() != FileStorage.__file_stamp:
+            self.reload()
 
     def get(self, cls, id):
-        """Returns the object based on the class and its ID, or None if not found"""
+        """Returns the object based on the class and its ID, or None if
+        not found"""
         if not cls or not id:
             return None
-        if type(cls) is not str:
-            cls_name = cls.__name__
-        
+        cls_name = cls if type(cls) is str else cls.__name__
         key = cls_name + "." + id
         return self.__objects.get(key, None)
-    
+
+    def get_with(self, cls, id, *relationships):
+        """Returns the object based on the class and its ID, or None if
+        not found; relationships are computed on access, so they are
+        ignored"""
+        return self.get(cls, id)
+
+    def exists(self, cls, id):
+        """Returns True if an object of the class with this ID exists"""
+        return self.get(cls, id) is not None
+
+    def query_by(self, cls, **filters):
+        """Returns the list of cls objects whose attributes equal filters"""
+        return [obj for obj in self.all(cls).values()
+                if all(getattr(obj, key, None) == value
+                       for key, value in filters.items())]
+
+    def link(self, place_id, amenity_id):
+        """Links the amenity to the place, returning False if they were
+        already linked; bumps the place's updated_at, since amenity_ids is
+        part of its serialized form"""
+        place = self.get(Place, place_id)
+        if place is None or amenity_id in place.amenity_ids:
+            return False
+        # rebinding keeps the class-level default list untouched
+        place.amenity_ids = place.amenity_ids + [amenity_id]
+        place.updated_at = datetime.utcnow()
+        return True
+
+    def unlink(self, place_id, amenity_id):
+        """Unlinks the amenity from the place, returning False if they were
+        not linked"""
+        place = self.get(Place, place_id)
+        if place is None or amenity_id not in place.amenity_ids:
+            return False
+        place.amenity_ids = [a_id for a_id in place.amenity_ids
+                             if a_id != amenity_id]
+        place.updated_at = datetime.utcnow()
+        return True
+
+    def fingerprint(self, cls, **filters):
+        """Returns the number of cls objects matching filters and their
+        latest updated_at"""
+        objs = self.query_by(cls, **filters)
+        if not objs:
+            return (0, None)
+        return (len(objs), max(obj.updated_at for obj in objs))
+
     def count(self, cls=None):
         """Returns the number of objects in storage matching the given class.
         If no class is passed, returns the count of all objects in storage."""
         if not cls:
             return len(self.all())
         else:
-            return len(self.all(cls))        
-        
+            return len(self.all(cls))
 
+    def count_all(self, cls_list=None):
+        """Returns a dictionary of object counts keyed by class name for each
+        class in cls_list (all classes if None), from the class index."""
+        if cls_list is None:
+            cls_list = classes.values()
+        by_class = self.__class_index()
+        return {cls.__name__: len(by_class.get(cls.__name__, {}))
+                for cls in cls_list}
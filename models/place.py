@@ -33,9 +33,10 @@ class Place(BaseModel, Base):
         price_by_night = Column(Integer, nullable=False, default=0)
         latitude = Column(Float, nullable=True)
         longitude = Column(Float, nullable=True)
-        reviews = relationship("Review", backref="place", cascade="all, delete, delete-orphan")
+        reviews = relationship("Review", back_populates="place",
+                               cascade="all, delete, delete-orphan")
         amenities = relationship("Amenity", secondary="place_amenity",
-                                 backref="place_amenities",
+                                 back_populates="place_amenities",
                                  viewonly=False)
     else:
         city_id = ""
@@ -0,0 +1,79 @@
+#!/usr/bin/python3
+"""
+Contains the tests of the Flask application of the API
+"""
+
+from api.v1.app import app
+from models import storage
+from models.state import State
+import pycodestyle
+import unittest
+from unittest import mock
+
+
+class TestAppDocs(unittest.TestCase):
+    """Tests to check the style of the API application tests"""
+
+    def test_pycodestyle_conformance_test_app(self):
+        """Test that tests/test_api/test_app.py conforms to pycodestyle."""
+        pycodestyles = pycodestyle.StyleGuide(quiet=True)
+        result = pycodestyles.check_files(['tests/test_api/test_app.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+
+class TestApp(unittest.TestCase):
+    """Test the error handler and the per-request commit of the API"""
+
+    def setUp(self):
+        """Set up a test client and a stored state"""
+        self.client = app.test_client()
+        self.state = State(name="App")
+        storage.new(self.state)
+        storage.save()
+        self.url = "/api/v1/states/" + self.state.id
+
+    def tearDown(self):
+        """Delete the stored state"""
+        storage.delete_by_id(State, self.state.id)
+        storage.save()
+
+    def test_not_found(self):
+        """Test that an unknown URL gets a JSON 404"""
+        response = self.client.get("/api/v1/nope")
+        self.assertEqual(response.status_code, 404)
+        self.assertEqual(response.mimetype, "application/json")
+        self.assertEqual(response.get_json(), {"error": "Not found"})
+
+    def test_commit_on_success(self):
+        """Test that a successful write is saved once and not rolled back"""
+        with mock.patch.object(storage, "save") as save, \
+                mock.patch.object(storage, "rollback") as rollback:
+            response = self.client.put(self.url, json={"name": "Saved"})
+        self.assertEqual(response.status_code, 200)
+        save.assert_called_once_with()
+        rollback.assert_not_called()
+
+    def test_rollback_on_error(self):
+        """Test that a failed write is rolled back and not saved"""
+        for response_of in (lambda: self.client.put(self.url, data="x"),
+                            lambda: self.client.delete("/api/v1/states/x")):
+            with mock.patch.object(storage, "save") as save, \
+                    mock.patch.object(storage, "rollback") as rollback:
+                response = response_of()
+            self.assertGreaterEqual(response.status_code, 400)
+            save.assert_not_called()
+            rollback.assert_called_once_with()
+
+    def test_no_commit_on_read(self):
+        """Test that a read request neither saves nor rolls back"""
+        with mock.patch.object(storage, "save") as save, \
+                mock.patch.object(storage, "rollback") as rollback:
+            response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        save.assert_not_called()
+        rollback.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
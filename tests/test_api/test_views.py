@@ -0,0 +1,378 @@
+#!/usr/bin/python3
+"""
+Contains the tests of the CRUD routes of the API views
+"""
+
+from api.v1.app import app
+from api.v1.views.helpers import MAX_ATTRIBUTES
+import models
+from models import storage
+from models.amenity import Amenity
+from models.city import City
+from models.place import Place
+from models.review import Review
+from models.state import State
+from models.user import User
+import pycodestyle
+import unittest
+
+
+class TestViewsDocs(unittest.TestCase):
+    """Tests to check the style of the API view tests"""
+
+    def test_pycodestyle_conformance_test_views(self):
+        """Test that tests/test_api/test_views.py conforms to pycodestyle."""
+        pycodestyles = pycodestyle.StyleGuide(quiet=True)
+        result = pycodestyles.check_files(['tests/test_api/test_views.py'])
+        self.assertEqual(result.total_errors, 0,
+                         "Found code style errors (and warnings).")
+
+
+class APITestCase(unittest.TestCase):
+    """Base class of the view tests: a test client plus the objects a test
+    creates, deleted again in reverse order once the test is over"""
+
+    def setUp(self):
+        """Set up a test client"""
+        self.client = app.test_client()
+        self.created = []
+
+    def tearDown(self):
+        """Delete the objects created by the test"""
+        for cls, id in reversed(self.created):
+            storage.delete_by_id(cls, id)
+        storage.save()
+
+    def make(self, cls, **kwargs):
+        """Store a new cls object with the given attributes"""
+        obj = cls(**kwargs)
+        storage.new(obj)
+        storage.save()
+        self.created.append((cls, obj.id))
+        return obj.id
+
+    def post(self, cls, url, **kwargs):
+        """POST to url, recording the object created on success"""
+        response = self.client.post(url, **kwargs)
+        if response.status_code == 201:
+            self.created.append((cls, response.get_json()["id"]))
+        return response
+
+    def assertError(self, response, status, message=None):
+        """Check the status and JSON error of a failed request"""
+        self.assertEqual(response.status_code, status)
+        if message is None:
+            message = "Not found"
+        self.assertEqual(response.get_json(), {"error": message})
+
+
+class TestIndex(APITestCase):
+    """Test the status and stats routes"""
+
+    def test_status(self):
+        """Test that /status answers OK"""
+        response = self.client.get("/api/v1/status")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {"status": "OK"})
+
+    def test_stats(self):
+        """Test that /stats counts the objects of every class"""
+        response = self.client.get("/api/v1/stats")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(set(response.get_json()),
+                         {"amenity", "city", "place", "review", "state",
+                          "user"})
+
+    def test_stats_after_write(self):
+        """Test that a write request refreshes the cached /stats"""
+        before = self.client.get("/api/v1/stats").get_json()["state"]
+        self.post(State, "/api/v1/states", json={"name": "Stats"})
+        after = self.client.get("/api/v1/stats").get_json()["state"]
+        self.assertEqual(after, before + 1)
+
+
+class TestStates(APITestCase):
+    """Test the State routes, served by the generic CRUD views"""
+
+    def test_list(self):
+        """Test that GET /states lists the states with an ETag"""
+        state_id = self.make(State, name="Listed")
+        response = self.client.get("/api/v1/states")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(state_id, [s["id"] for s in response.get_json()])
+        self.assertIsNotNone(response.get_etag()[0])
+
+    def test_list_not_modified(self):
+        """Test that a current If-None-Match gets a 304, and a write a new
+        ETag"""
+        self.make(State, name="Cached")
+        etag = self.client.get("/api/v1/states").get_etag()[0]
+        response = self.client.get("/api/v1/states",
+                                   headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.data, b"")
+        self.post(State, "/api/v1/states", json={"name": "New"})
+        response = self.client.get("/api/v1/states",
+                                   headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertNotEqual(response.get_etag()[0], etag)
+
+    def test_get(self):
+        """Test GET /states/<id> for an existing and a missing state"""
+        state_id = self.make(State, name="Got")
+        response = self.client.get("/api/v1/states/" + state_id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["name"], "Got")
+        self.assertError(self.client.get("/api/v1/states/nope"), 404)
+
+    def test_create(self):
+        """Test POST /states and its errors"""
+        response = self.post(State, "/api/v1/states", json={"name": "Made"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()["name"], "Made")
+        self.assertIsNotNone(storage.get(State, response.get_json()["id"]))
+        self.assertError(self.client.post("/api/v1/states", data="name"),
+                         400, "Not a JSON")
+        self.assertError(self.client.post("/api/v1/states", json=[]),
+                         400, "Not a JSON")
+        self.assertError(self.client.post("/api/v1/states", json={}),
+                         400, "Missing name")
+
+    def test_update(self):
+        """Test PUT /states/<id>, which leaves protected keys unchanged"""
+        state_id = self.make(State, name="Old")
+        response = self.client.put("/api/v1/states/" + state_id,
+                                   json={"name": "New", "id": "other"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["name"], "New")
+        self.assertEqual(response.get_json()["id"], state_id)
+        self.assertEqual(storage.get(State, state_id).name, "New")
+
+    def test_update_errors(self):
+        """Test that PUT /states/<id> checks the state before the body"""
+        state_id = self.make(State, name="Kept")
+        self.assertError(self.client.put("/api/v1/states/nope", data="x"),
+                         404)
+        self.assertError(self.client.put("/api/v1/states/" + state_id,
+                                         data="x"), 400, "Not a JSON")
+        payload = {str(i): i for i in range(MAX_ATTRIBUTES + 1)}
+        self.assertError(self.client.put("/api/v1/states/" + state_id,
+                                         json=payload),
+                         400, "Too many attributes")
+        self.assertEqual(storage.get(State, state_id).name, "Kept")
+
+    def test_delete(self):
+        """Test DELETE /states/<id> for an existing and a missing state"""
+        state_id = self.make(State, name="Gone")
+        response = self.client.delete("/api/v1/states/" + state_id)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json(), {})
+        self.assertIsNone(storage.get(State, state_id))
+        self.assertError(self.client.delete("/api/v1/states/" + state_id),
+                         404)
+
+
+class TestUsers(APITestCase):
+    """Test the User routes"""
+
+    def test_create(self):
+        """Test POST /users, which checks email before password"""
+        response = self.post(User, "/api/v1/users",
+                             json={"email": "a@b.c", "password": "pwd"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()["email"], "a@b.c")
+        self.assertError(self.client.post("/api/v1/users", json={}),
+                         400, "Missing email")
+        self.assertError(self.client.post("/api/v1/users",
+                                          json={"email": "a@b.c"}),
+                         400, "Missing password")
+
+    def test_update(self):
+        """Test that PUT /users/<id> does not change the email"""
+        user_id = self.make(User, email="old@b.c", password="pwd")
+        response = self.client.put("/api/v1/users/" + user_id,
+                                   json={"email": "new@b.c",
+                                         "first_name": "Ann"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["email"], "old@b.c")
+        self.assertEqual(response.get_json()["first_name"], "Ann")
+
+
+class TestAmenities(APITestCase):
+    """Test the Amenity routes"""
+
+    def test_list_and_get(self):
+        """Test GET /amenities and /amenities/<id>"""
+        amenity_id = self.make(Amenity, name="Wifi")
+        response = self.client.get("/api/v1/amenities")
+        self.assertEqual(response.status_code, 200)
+        self.assertIn(amenity_id, [a["id"] for a in response.get_json()])
+        response = self.client.get("/api/v1/amenities/" + amenity_id)
+        self.assertEqual(response.get_json()["name"], "Wifi")
+        self.assertError(self.client.get("/api/v1/amenities/nope"), 404)
+
+    def test_create(self):
+        """Test POST /amenities and its errors"""
+        response = self.post(Amenity, "/api/v1/amenities",
+                             json={"name": "Pool"})
+        self.assertEqual(response.status_code, 201)
+        self.assertError(self.client.post("/api/v1/amenities", data="x"),
+                         400, "Not a JSON")
+        self.assertError(self.client.post("/api/v1/amenities", json={}),
+                         400, "Missing name")
+
+    def test_update_and_delete(self):
+        """Test PUT and DELETE /amenities/<id>"""
+        amenity_id = self.make(Amenity, name="Old")
+        url = "/api/v1/amenities/" + amenity_id
+        self.assertError(self.client.put("/api/v1/amenities/nope",
+                                         data="x"), 404)
+        self.assertError(self.client.put(url, data="x"), 400, "Not a JSON")
+        response = self.client.put(url, json={"name": "New"})
+        self.assertEqual(response.get_json()["name"], "New")
+        self.assertEqual(self.client.delete(url).status_code, 200)
+        self.assertError(self.client.delete(url), 404)
+
+
+class TestCities(APITestCase):
+    """Test the City routes"""
+
+    def setUp(self):
+        """Set up a state to hold the cities"""
+        super().setUp()
+        self.state_id = self.make(State, name="Parent")
+        self.url = "/api/v1/states/{}/cities".format(self.state_id)
+
+    def test_list(self):
+        """Test GET /states/<id>/cities, with its ETag"""
+        city_id = self.make(City, name="Town", state_id=self.state_id)
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual([c["id"] for c in response.get_json()], [city_id])
+        etag = response.get_etag()[0]
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 304)
+        self.assertError(self.client.get("/api/v1/states/nope/cities"), 404)
+
+    def test_create(self):
+        """Test that POST /states/<id>/cities checks the state first"""
+        response = self.post(City, self.url, json={"name": "Town"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()["state_id"], self.state_id)
+        self.assertError(self.client.post("/api/v1/states/nope/cities",
+                                          json={}), 404)
+        self.assertError(self.client.post(self.url, data="x"),
+                         400, "Not a JSON")
+        self.assertError(self.client.post(self.url, json={}),
+                         400, "Missing name")
+
+    def test_update(self):
+        """Test that PUT /cities/<id> does not move the city"""
+        city_id = self.make(City, name="Town", state_id=self.state_id)
+        response = self.client.put("/api/v1/cities/" + city_id,
+                                   json={"name": "City", "state_id": "x"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()["name"], "City")
+        self.assertEqual(response.get_json()["state_id"], self.state_id)
+        self.assertError(self.client.put("/api/v1/cities/nope", data="x"),
+                         404)
+
+
+class TestPlaces(APITestCase):
+    """Test the Place, Review and Place-Amenity routes"""
+
+    def setUp(self):
+        """Set up a city and a user to hold the places"""
+        super().setUp()
+        state_id = self.make(State, name="Parent")
+        self.city_id = self.make(City, name="Town", state_id=state_id)
+        self.user_id = self.make(User, email="a@b.c", password="pwd")
+        self.url = "/api/v1/cities/{}/places".format(self.city_id)
+
+    def test_create(self):
+        """Test that POST /cities/<id>/places checks the city, then each
+        required field with its reference"""
+        response = self.post(Place, self.url,
+                             json={"user_id": self.user_id, "name": "Flat"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()["city_id"], self.city_id)
+        self.assertError(self.client.post("/api/v1/cities/nope/places",
+                                          data="x"), 404)
+        self.assertError(self.client.post(self.url, data="x"),
+                         400, "Not a JSON")
+        self.assertError(self.client.post(self.url, json={"name": "Flat"}),
+                         400, "Missing user_id")
+        self.assertError(self.client.post(self.url,
+                                          json={"user_id": "nope"}), 404)
+        self.assertError(self.client.post(self.url,
+                                          json={"user_id": self.user_id}),
+                         400, "Missing name")
+
+    def test_list_and_update(self):
+        """Test GET /cities/<id>/places and PUT /places/<id>"""
+        place_id = self.make(Place, name="Flat", city_id=self.city_id,
+                             user_id=self.user_id)
+        response = self.client.get(self.url)
+        self.assertEqual([p["id"] for p in response.get_json()], [place_id])
+        self.assertError(self.client.get("/api/v1/cities/nope/places"), 404)
+        response = self.client.put("/api/v1/places/" + place_id,
+                                   json={"name": "House", "user_id": "x"})
+        self.assertEqual(response.get_json()["name"], "House")
+        self.assertEqual(response.get_json()["user_id"], self.user_id)
+
+    def test_reviews(self):
+        """Test that POST /places/<id>/reviews checks the place first"""
+        place_id = self.make(Place, name="Flat", city_id=self.city_id,
+                             user_id=self.user_id)
+        url = "/api/v1/places/{}/reviews".format(place_id)
+        self.assertError(self.client.post("/api/v1/places/nope/reviews",
+                                          data="x"), 404)
+        self.assertError(self.client.post(url, data="x"), 400, "Not a JSON")
+        self.assertError(self.client.post(url, json={"text": "Nice"}),
+                         400, "Missing user_id")
+        self.assertError(self.client.post(url, json={"user_id": "nope"}),
+                         404)
+        self.assertError(self.client.post(url,
+                                          json={"user_id": self.user_id}),
+                         400, "Missing text")
+        response = self.post(Review, url, json={"user_id": self.user_id,
+                                                "text": "Nice"})
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.get_json()["place_id"], place_id)
+        response = self.client.get(url)
+        self.assertEqual([r["text"] for r in response.get_json()], ["Nice"])
+
+    def test_amenities(self):
+        """Test linking and unlinking an amenity"""
+        place_id = self.make(Place, name="Flat", city_id=self.city_id,
+                             user_id=self.user_id)
+        amenity_id = self.make(Amenity, name="Wifi")
+        url = "/api/v1/places/{}/amenities/{}".format(place_id, amenity_id)
+        self.assertEqual(self.client.post(url).status_code, 201)
+        self.assertEqual(self.client.post(url).status_code, 200)
+        response = self.client.get(
+            "/api/v1/places/{}/amenities".format(place_id))
+        self.assertEqual([a["id"] for a in response.get_json()],
+                         [amenity_id])
+        self.assertEqual(self.client.delete(url).status_code, 200)
+        self.assertError(self.client.delete(url), 404)
+        self.assertError(self.client.post(
+            "/api/v1/places/{}/amenities/nope".format(place_id)), 404)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_amenities_etag(self):
+        """Test that linking an amenity changes the ETag of the places,
+        whose amenity_ids it changes"""
+        place_id = self.make(Place, name="Flat", city_id=self.city_id,
+                             user_id=self.user_id)
+        amenity_id = self.make(Amenity, name="Wifi")
+        etag = self.client.get(self.url).get_etag()[0]
+        self.client.post("/api/v1/places/{}/amenities/{}".format(
+            place_id, amenity_id))
+        response = self.client.get(self.url, headers={"If-None-Match": etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()[0]["amenity_ids"], [amenity_id])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -138,6 +138,25 @@ class TestBaseModel(unittest.TestCase):
         self.assertEqual(new_d["created_at"], bm.created_at.strftime(t_format))
         self.assertEqual(new_d["updated_at"], bm.updated_at.strftime(t_format))
 
+    @unittest.skipIf(models.storage_t == 'db',
+                     "BaseModel is not mapped to a table in db storage")
+    def test_bulk_to_dicts(self):
+        """test that bulk_to_dicts matches to_dict for every object"""
+        objs = [BaseModel(), BaseModel()]
+        objs[0].name = "Holberton"
+        self.assertEqual(BaseModel.bulk_to_dicts(objs),
+                         [obj.to_dict() for obj in objs])
+        self.assertEqual(BaseModel.bulk_to_dicts([]), [])
+
+    def test_strftime(self):
+        """test that strftime formats like to_dict and memoizes the result"""
+        dt = datetime(2017, 9, 28, 21, 3, 54, 52298)
+        strftime = models.base_model.strftime
+        self.assertEqual(strftime(dt), "2017-09-28T21:03:54.052298")
+        hits = strftime.cache_info().hits
+        strftime(datetime(2017, 9, 28, 21, 3, 54, 52298))
+        self.assertEqual(strftime.cache_info().hits, hits + 1)
+
     def test_str(self):
         """test that the str method has the correct output"""
         inst = BaseModel()
@@ -86,3 +86,28 @@ class TestFileStorage(unittest.TestCase):
     @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
     def test_save(self):
         """Test that save properly saves objects to file.json"""
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_count_all(self):
+        """Test that count_all matches count for every class"""
+        counts = models.storage.count_all()
+        for key, value in classes.items():
+            with self.subTest(key=key):
+                self.assertEqual(counts[key], models.storage.count(value))
+
+    @unittest.skipIf(models.storage_t != 'db', "not testing db storage")
+    def test_fingerprint(self):
+        """Test that fingerprint changes when an object is replaced by
+        another with the same updated_at"""
+        stamp = datetime(2017, 9, 28, 21, 3, 54)
+        first = State(name="fingerprint", updated_at=stamp)
+        models.storage.new(first)
+        before = models.storage.fingerprint(State, name="fingerprint")
+        models.storage.delete(first)
+        second = State(name="fingerprint", updated_at=stamp)
+        models.storage.new(second)
+        after = models.storage.fingerprint(State, name="fingerprint")
+        models.storage.rollback()
+        self.assertEqual(before[0], 1)
+        self.assertEqual(after[0], 1)
+        self.assertNotEqual(before, after)
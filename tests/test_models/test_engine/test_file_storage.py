@@ -113,3 +113,155 @@ class TestFileStorage(unittest.TestCase):
         with open("file.json", "r") as f:
             js = f.read()
         self.assertEqual(json.loads(string), json.loads(js))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_count_all(self):
+        """Test that count_all counts the objects of each class"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        for value in [State(), State(), City()]:
+            storage.new(value)
+        counts = storage.count_all([State, City, User])
+        FileStorage._FileStorage__objects = save
+        self.assertEqual(counts, {"State": 2, "City": 1, "User": 0})
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_close_unchanged_file(self):
+        """Test that close does not reload a file that has not changed"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        state = State()
+        storage.new(state)
+        storage.save()
+        storage.close()
+        obj = storage.all()["State." + state.id]
+        FileStorage._FileStorage__objects = save
+        self.assertIs(obj, state)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_get(self):
+        """Test that get finds an object by class or class name and id"""
+        storage = FileStorage()
+        state = State()
+        storage.new(state)
+        self.assertIs(storage.get(State, state.id), state)
+        self.assertIs(storage.get("State", state.id), state)
+        self.assertIsNone(storage.get(City, state.id))
+        self.assertIsNone(storage.get(State, "missing"))
+        storage.delete(state)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_fingerprint(self):
+        """Test that fingerprint counts matching objects and their latest
+        update"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        cities = [City(state_id="1"), City(state_id="1"), City(state_id="2")]
+        for city in cities:
+            storage.new(city)
+        latest = max(cities[0].updated_at, cities[1].updated_at)
+        self.assertEqual(storage.fingerprint(City, state_id="1"), (2, latest))
+        self.assertEqual(storage.fingerprint(State), (0, None))
+        FileStorage._FileStorage__objects = save
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_exists(self):
+        """Test that exists reports whether an object is stored"""
+        storage = FileStorage()
+        state = State()
+        storage.new(state)
+        self.assertTrue(storage.exists(State, state.id))
+        self.assertTrue(storage.exists("State", state.id))
+        self.assertFalse(storage.exists(City, state.id))
+        storage.delete(state)
+        self.assertFalse(storage.exists(State, state.id))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_query_by(self):
+        """Test that query_by returns the objects matching the filters"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        reviews = [Review(place_id="1"), Review(place_id="2")]
+        for review in reviews:
+            storage.new(review)
+        self.assertEqual(storage.query_by(Review, place_id="1"),
+                         [reviews[0]])
+        self.assertEqual(storage.query_by(Review, place_id="3"), [])
+        FileStorage._FileStorage__objects = save
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_delete_by_id(self):
+        """Test that delete_by_id removes an object by class and id"""
+        storage = FileStorage()
+        review = Review()
+        storage.new(review)
+        self.assertTrue(storage.delete_by_id(Review, review.id))
+        self.assertIsNone(storage.get(Review, review.id))
+        self.assertFalse(storage.delete_by_id(Review, review.id))
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_rollback(self):
+        """Test that rollback keeps the objects other requests added"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        pending = State()
+        storage.new(pending)
+        storage.rollback()
+        objs = storage.all(State)
+        FileStorage._FileStorage__objects = save
+        self.assertIn("State." + pending.id, objs)
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_all_class_index(self):
+        """Test that all(cls) follows new, delete and direct changes"""
+        storage = FileStorage()
+        save = FileStorage._FileStorage__objects
+        FileStorage._FileStorage__objects = {}
+        state = State()
+        city = City()
+        storage.new(state)
+        storage.new(city)
+        states = storage.all(State)
+        storage.delete(city)
+        cities = storage.all("City")
+        storage.all().pop("State." + state.id)
+        after_pop = storage.all(State)
+        FileStorage._FileStorage__objects = save
+        self.assertEqual(states, {"State." + state.id: state})
+        self.assertEqual(cities, {})
+        self.assertEqual(after_pop, {})
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_link_unlink(self):
+        """Test that link and unlink edit only the place's amenity_ids"""
+        storage = FileStorage()
+        place = Place()
+        other = Place()
+        storage.new(place)
+        self.assertTrue(storage.link(place.id, "amenity"))
+        self.assertFalse(storage.link(place.id, "amenity"))
+        self.assertFalse(storage.link("missing", "amenity"))
+        self.assertEqual(place.amenity_ids, ["amenity"])
+        self.assertEqual(other.amenity_ids, [])
+        self.assertTrue(storage.unlink(place.id, "amenity"))
+        self.assertFalse(storage.unlink(place.id, "amenity"))
+        self.assertEqual(place.amenity_ids, [])
+
+    @unittest.skipIf(models.storage_t == 'db', "not testing file storage")
+    def test_link_changes_fingerprint(self):
+        """Test that link and unlink change the fingerprint of the places"""
+        storage = FileStorage()
+        place = Place()
+        place.updated_at = datetime(2000, 1, 1)
+        storage.new(place)
+        before = storage.fingerprint(Place)
+        storage.link(place.id, "amenity")
+        self.assertNotEqual(storage.fingerprint(Place), before)
+        place.updated_at = datetime(2000, 1, 1)
+        storage.unlink(place.id, "amenity")
+        self.assertNotEqual(storage.fingerprint(Place), before)
@@ -98,6 +98,12 @@ class TestState(unittest.TestCase):
         self.assertEqual(new_d["created_at"], s.created_at.strftime(t_format))
         self.assertEqual(new_d["updated_at"], s.updated_at.strftime(t_format))
 
+    def test_bulk_to_dicts(self):
+        """test that bulk_to_dicts matches to_dict for every state"""
+        states = [State(name="California"), State(name="Arizona")]
+        self.assertEqual(State.bulk_to_dicts(states),
+                         [s.to_dict() for s in states])
+
     def test_str(self):
         """test that the str method has the correct output"""
         state = State()
@@ -125,6 +125,14 @@ class TestUser(unittest.TestCase):
         self.assertEqual(new_d["created_at"], u.created_at.strftime(t_format))
         self.assertEqual(new_d["updated_at"], u.updated_at.strftime(t_format))
 
+    def test_bulk_to_dicts(self):
+        """test that bulk_to_dicts matches to_dict and omits the password"""
+        user = User(email="a@b.c", password="pwd", first_name="Betty",
+                    last_name="Holberton")
+        dicts = User.bulk_to_dicts([user])
+        self.assertEqual(dicts, [user.to_dict()])
+        self.assertNotIn("password", dicts[0])
+
     def test_str(self):
         """test that the str method has the correct output"""
         user = User()